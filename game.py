@@ -28,7 +28,12 @@ class Game:
         self.logger.info("Game initialized...")
         pygame.init()
         self.running = self.playing = True
-        self.actions = {"jump": False, "pause": False}
+        self.actions = {
+            "jump": False,
+            "pause": False,
+            "autopilot": False,
+            "rewind": False,
+        }
         self.dt, self.prev_time = 0, 0
         self.screen = display.set_mode(
             (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.SRCALPHA
@@ -103,6 +108,12 @@ class Game:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 self.actions["pause"] = True
 
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+                self.actions["autopilot"] = True
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                self.actions["rewind"] = True
+
     def update(self):
         """Update the current state"""
         self.state_stack[-1].update(self.dt, self.actions)
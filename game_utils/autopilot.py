@@ -0,0 +1,165 @@
+import time
+from math import copysign
+
+from game_utils.game_sprites import Bird, Pipe
+
+
+def round_like_rect(value):
+    """Rounds halves away from zero, like pygame does when a float is assigned to a Rect coordinate."""
+    return int(value + copysign(0.5, value))
+
+
+class BudgetExceeded(Exception):
+    """Raised when the lookahead search runs out of its time budget."""
+
+
+class Autopilot:
+    HORIZON_FRAMES = 48
+    DECISION_FRAMES = 4
+    TIME_BUDGET = 0.002
+    SAFETY_MARGIN = 3
+    VELOCITY_QUANTUM = 0.5
+    FRAME_STEP_RANGE = (0.5, 2.0)
+
+    def __init__(self, game, horizon_frames=HORIZON_FRAMES, time_budget=TIME_BUDGET):
+        """
+        Initializes an Autopilot that plays the game world by searching ahead over jump/no-jump decisions.
+
+        :param game: Reference to the main game object.
+        :param horizon_frames: Number of frames the bird has to survive for a decision to be safe.
+        :param time_budget: Maximum time in seconds spent searching per decision.
+        """
+        self.game = game
+        self.horizon_frames = horizon_frames
+        self.time_budget = time_budget
+        self.bird_width, self.bird_height = self.game.bird_images[0].get_size()
+        self.pipe_width, self.pipe_height = self.game.pipe_image.get_size()
+        self.visited = {}
+        self.target_y = self.game.HALF_SCREEN_HEIGHT
+        self.deadline = 0
+        self.decisions = 0
+        self.budget_exceeded = 0
+
+    def decide(self, snapshot, delta_time):
+        """
+        Decides whether the bird should jump on this frame.
+
+        Bird and pipes are simulated on the snapshot's plain values instead of the sprites, so each
+        candidate move costs a few arithmetic operations. Pipes spawned during the lookahead appear at
+        the right edge of the screen and cannot reach the bird within the horizon, so they are ignored.
+
+        :param snapshot: WorldSnapshot of the current game world.
+        :param delta_time: Time elapsed since the last frame.
+        :return: True if the bird should jump, False otherwise.
+        """
+        self.decisions += 1
+        step = min(
+            max(delta_time * self.game.TARGET_FPS, self.FRAME_STEP_RANGE[0]),
+            self.FRAME_STEP_RANGE[1],
+        )
+        (bird_x, bird_y), vel, _, _ = snapshot.bird
+        obstacles = self.predict_obstacles(snapshot.pipes, bird_x, step)
+        self.target_y = self.next_gap_centre(snapshot.pipes, bird_x)
+        self.visited = {}
+        self.deadline = time.perf_counter() + self.time_budget
+        try:
+            for jump in self.candidate_moves(bird_y, vel):
+                if self.survives_decision(obstacles, 0, bird_y, vel, jump, step):
+                    return jump
+        except BudgetExceeded:
+            self.budget_exceeded += 1
+        return self.steer(bird_y, vel)
+
+    def predict_obstacles(self, pipes, bird_x, step):
+        """
+        Precomputes, for every frame of the horizon, the vertical spans blocked by pipes overlapping
+        the bird's column.
+
+        :return: list with a tuple of (top, bottom) spans per frame.
+        """
+        bird_left = bird_x - self.SAFETY_MARGIN
+        bird_right = bird_x + self.bird_width + self.SAFETY_MARGIN
+        pipe_speed = self.game.SCROLL_SPEED * step
+        positions = [(x, y) for _, (x, y) in pipes]
+        obstacles = []
+        for _ in range(self.horizon_frames):
+            positions = [(round_like_rect(x - pipe_speed), y) for x, y in positions]
+            obstacles.append(
+                tuple(
+                    (y, y + self.pipe_height)
+                    for x, y in positions
+                    if x < bird_right and x + self.pipe_width > bird_left
+                )
+            )
+        return obstacles
+
+    def survives_decision(self, obstacles, frame, bird_y, vel, jump, step):
+        """
+        Simulates one decision (jump on its first frame or not) and searches the decisions after it.
+
+        :return: True if some sequence of decisions keeps the bird alive until the horizon.
+        """
+        if time.perf_counter() > self.deadline:
+            raise BudgetExceeded
+        for offset in range(self.DECISION_FRAMES):
+            if frame >= self.horizon_frames:
+                return True
+            vel = min(vel + Bird.GRAVITY * step, Bird.MAX_FALL_SPEED)
+            if bird_y + self.bird_height < self.game.GROUND_Y_POS:
+                bird_y += int(vel)
+            if jump and offset == 0:
+                vel = Bird.JUMP_VELOCITY
+            if self.collides(obstacles[frame], bird_y):
+                return False
+            frame += 1
+        if frame >= self.horizon_frames:
+            return True
+
+        key = (frame, bird_y, round(vel / self.VELOCITY_QUANTUM))
+        if key not in self.visited:
+            self.visited[key] = any(
+                self.survives_decision(obstacles, frame, bird_y, vel, next_jump, step)
+                for next_jump in self.candidate_moves(bird_y, vel)
+            )
+        return self.visited[key]
+
+    def collides(self, spans, bird_y):
+        """Checks whether the bird at the given height hits a pipe, the ceiling or the ground."""
+        top = bird_y - self.SAFETY_MARGIN
+        bottom = bird_y + self.bird_height + self.SAFETY_MARGIN
+        if top < 0 or bottom >= self.game.GROUND_Y_POS:
+            return True
+        return any(
+            top < span_bottom and bottom > span_top for span_top, span_bottom in spans
+        )
+
+    def next_gap_centre(self, pipes, bird_x):
+        """
+        Finds the height of the centre of the next pipe gap ahead of the bird.
+
+        :return: Y-coordinate of the gap centre, or the middle of the screen if no pipe is ahead.
+        """
+        next_bottom_pipe = min(
+            (
+                (x, y)
+                for pipe_position, (x, y) in pipes
+                if pipe_position == "bottom" and x + self.pipe_width > bird_x
+            ),
+            default=None,
+        )
+        if next_bottom_pipe:
+            return next_bottom_pipe[1] - Pipe.PIPE_VERTICAL_GAP // 2
+        return self.game.HALF_SCREEN_HEIGHT
+
+    def steer(self, bird_y, vel):
+        """
+        Steers towards the centre of the next pipe gap, used when the search finds no safe move in time.
+
+        :return: True if the bird should jump, False otherwise.
+        """
+        return bird_y + self.bird_height // 2 > self.target_y and vel >= 0
+
+    def candidate_moves(self, bird_y, vel):
+        """Orders jump/no-jump so the move steering towards the next gap is searched first."""
+        preferred = self.steer(bird_y, vel)
+        return preferred, not preferred
@@ -3,6 +3,7 @@ from pygame import transform
 
 
 class Bird(pygame.sprite.Sprite):
+    GRAVITY = 0.5
     MAX_FALL_SPEED = 8
     ROTATION_FACTOR = -2
     JUMP_VELOCITY = -7
@@ -31,7 +32,7 @@ class Bird(pygame.sprite.Sprite):
         Updates the bird's movement, handles jumping & flapping animation.
         """
         # Bird downward movement (gravity)
-        self.vel += 0.5 * delta_time * self.game.TARGET_FPS
+        self.vel += self.GRAVITY * delta_time * self.game.TARGET_FPS
         self.vel = min(self.vel, self.MAX_FALL_SPEED)
         if self.rect.bottom < self.game.GROUND_Y_POS:
             self.rect.y += int(self.vel)
@@ -51,6 +52,25 @@ class Bird(pygame.sprite.Sprite):
             surface=self.images[self.index], angle=self.vel * self.ROTATION_FACTOR
         )
 
+    def get_state(self):
+        """
+        Returns a compact, immutable copy of the bird's state.
+
+        :return: tuple of (rect top-left, velocity, animation index, animation timer).
+        """
+        return self.rect.topleft, self.vel, self.index, self.animation_timer
+
+    def set_state(self, state):
+        """
+        Restores the bird's state from a tuple returned by get_state.
+
+        :param state: tuple of (rect top-left, velocity, animation index, animation timer).
+        """
+        self.rect.topleft, self.vel, self.index, self.animation_timer = state
+        self.image = transform.rotate(
+            surface=self.images[self.index], angle=self.vel * self.ROTATION_FACTOR
+        )
+
 
 class Pipe(pygame.sprite.Sprite):
     PIPE_VERTICAL_GAP = 150
@@ -67,6 +87,7 @@ class Pipe(pygame.sprite.Sprite):
         self.game = game
         self.image = self.game.pipe_image
         self.rect = self.image.get_rect()
+        self.pipe_position = pipe_position
         pipe_gap_half = self.PIPE_VERTICAL_GAP // 2
         if pipe_position == "top":
             self.image = transform.flip(surface=self.image, flip_x=False, flip_y=True)
@@ -81,3 +102,23 @@ class Pipe(pygame.sprite.Sprite):
         self.rect.x -= self.game.SCROLL_SPEED * delta_time * self.game.TARGET_FPS
         if self.rect.right < 0:
             self.kill()
+
+    def get_state(self):
+        """
+        Returns a compact, immutable copy of the pipe's state.
+
+        :return: tuple of (pipe position, rect top-left).
+        """
+        return self.pipe_position, self.rect.topleft
+
+    @classmethod
+    def from_state(cls, state, game):
+        """
+        Creates a Pipe from a tuple returned by get_state.
+
+        :param state: tuple of (pipe position, rect top-left).
+        """
+        pipe_position, topleft = state
+        pipe = cls(0, 0, pipe_position, game)
+        pipe.rect.topleft = topleft
+        return pipe
@@ -0,0 +1,63 @@
+from collections import deque, namedtuple
+
+# Compact, immutable copy of everything the game world needs to resume play.
+# bird: tuple returned by Bird.get_state
+# pipes: tuple of tuples returned by Pipe.get_state, in pipe group order
+# random_state: state of the world's random generator used for pipe heights
+WorldSnapshot = namedtuple(
+    "WorldSnapshot",
+    [
+        "bird",
+        "pipes",
+        "last_pipe",
+        "score",
+        "passing_through_pipe",
+        "ground_scroll",
+        "random_state",
+    ],
+)
+
+
+class SnapshotBuffer:
+    def __init__(self, max_seconds):
+        """
+        Initializes a ring buffer holding the world snapshots of the most recent seconds of game time.
+
+        :param max_seconds: Game time covered before the oldest snapshots are dropped.
+        """
+        self.max_seconds = max_seconds
+        self.snapshots = deque()
+
+    def __len__(self):
+        """Returns the number of stored snapshots."""
+        return len(self.snapshots)
+
+    def push(self, snapshot, game_time):
+        """
+        Stores a snapshot, dropping the ones older than max_seconds of game time.
+
+        :param snapshot: WorldSnapshot to store.
+        :param game_time: Game time in seconds at which the snapshot was taken.
+        """
+        self.snapshots.append((game_time, snapshot))
+        while game_time - self.snapshots[0][0] > self.max_seconds:
+            self.snapshots.popleft()
+
+    def rewind(self, seconds):
+        """
+        Discards the newest snapshots and returns the one taken `seconds` of game time before the newest.
+
+        :param seconds: Game time to go back, 0 returns the newest snapshot.
+        :return: WorldSnapshot, the oldest one if the buffer holds less game time, or None if it is empty.
+        """
+        if not self.snapshots:
+            return None
+        target_time = self.snapshots[-1][0] - seconds
+        game_time, snapshot = self.snapshots.pop()
+        while self.snapshots and game_time > target_time:
+            game_time, snapshot = self.snapshots.pop()
+        return snapshot
+
+    def clear(self):
+        """Removes all stored snapshots."""
+        self.snapshots.clear()
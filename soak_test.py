@@ -0,0 +1,89 @@
+import argparse
+import os
+import random
+import time
+
+# Run without a window or sound card so the soak test works on headless machines
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game import Game  # noqa: E402
+from game_utils.logger import Logger  # noqa: E402
+from states.game_world import GameWorld  # noqa: E402
+
+
+def start_world(game, seed):
+    """Push a new autopilot controlled game world onto the state stack."""
+    world = GameWorld(game, seed=seed, autopilot=True)
+    world.enter_state()
+    return world
+
+
+def run_soak_test(game, duration, seed=None, render=False):
+    """
+    Lets the autopilot play the game world for the given duration of game time, restarting after every
+    crash. A crash means the generated pipe layout was not passable or the game loop misbehaved.
+
+    :param game: Reference to the main game object.
+    :param duration: Game time to play, in seconds.
+    :param seed: Seed for the first game world, incremented on every restart. A random seed is drawn
+    if not given so every crash can be reproduced.
+    :param render: Whether to render every frame onto the (dummy) screen as well.
+    :return: list of (seed, score, snapshot before the crash) for every crash.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    game.logger.info(f"Starting soak test with seed {seed}")
+    game.dt = 1 / game.TARGET_FPS
+    world = start_world(game, seed)
+    crashes = []
+    decisions = budget_exceeded = 0
+    for _ in range(int(duration * game.TARGET_FPS)):
+        if render:
+            game.render()
+        game.update()
+        game.reset_keys()
+        if game.state_stack[-1] is not world:
+            crash_snapshot = world.rewind_buffer.rewind(0)
+            crashes.append((seed, world.score, crash_snapshot))
+            game.logger.error(
+                f"Autopilot crashed with seed {seed} at score {world.score}, "
+                f"bird: {crash_snapshot.bird}, pipes: {crash_snapshot.pipes}"
+            )
+            decisions += world.autopilot.decisions
+            budget_exceeded += world.autopilot.budget_exceeded
+            # Drop the game over menu and the crashed world
+            game.state_stack[-1].exit_state()
+            world.exit_state()
+            seed += 1
+            world = start_world(game, seed)
+    decisions += world.autopilot.decisions
+    budget_exceeded += world.autopilot.budget_exceeded
+    game.logger.info(
+        f"Soak test finished: {decisions} decisions, {budget_exceeded} over the time budget, "
+        f"{len(crashes)} crashes"
+    )
+    return crashes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Let the autopilot play the game headlessly."
+    )
+    parser.add_argument(
+        "--duration", type=float, default=600, help="game time to play in seconds"
+    )
+    parser.add_argument("--seed", type=int, help="seed for the pipe heights")
+    parser.add_argument(
+        "--render", action="store_true", help="render every frame as well"
+    )
+    args = parser.parse_args()
+    log = Logger(name="Flappy-Bird-Soak-Test", log_file="soak_test.log").get_logger()
+    g = Game(log)
+    start = time.perf_counter()
+    crash_list = run_soak_test(g, args.duration, args.seed, args.render)
+    print(
+        f"Played {args.duration}s of game time in {time.perf_counter() - start:.1f}s "
+        f"with {len(crash_list)} crashes"
+    )
+    raise SystemExit(1 if crash_list else 0)
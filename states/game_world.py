@@ -1,9 +1,11 @@
-from random import SystemRandom
+from random import Random
 
 import pygame
 from pygame import mixer, sprite
 
+from game_utils.autopilot import Autopilot
 from game_utils.game_sprites import Bird, Pipe
+from game_utils.world_snapshot import SnapshotBuffer, WorldSnapshot
 from states.pause_menu import PauseMenu
 from states.state import State
 
@@ -15,14 +17,20 @@ class GameWorld(State):
     HIGH_SCORE_Y_POS = 40
     GROUND_SCROLL_LIMIT = 35
     PIPE_HEIGHT_RANGE = (-100, 100)
+    REWIND_BUFFER_SECONDS = 3
+    REWIND_SECONDS = 1
 
-    def __init__(self, game):
+    def __init__(self, game, seed=None, autopilot=False):
         """
         Initializes the GameWorld instance with the necessary properties, loads sound, creates a bird sprite
         & renders a first pair of pipes onto screen as soon as game starts.
+        :param game: Reference to the main game object.
+        :param seed: Seed for the pipe height generator, random if not given.
+        :param autopilot: Whether the bird is played by the autopilot from the start, autopilot scores
+        never count towards the high score.
         """
         State.__init__(self, game)
-        self.random_generator = SystemRandom()
+        self.random_generator = Random(seed)
         self.last_pipe = 0
         self.score = 0
         self.passing_through_pipe = None
@@ -36,6 +44,10 @@ class GameWorld(State):
         self.bird = Bird(self.BIRD_INITIAL_X, self.game.HALF_SCREEN_HEIGHT - 100, game)
         self.bird_group.add(self.bird)
         self.create_pipe()
+        self.play_time = 0
+        self.rewind_buffer = SnapshotBuffer(self.REWIND_BUFFER_SECONDS)
+        self.autopilot = Autopilot(self.game) if autopilot else None
+        self.counts_for_high_score = not autopilot
 
     def update(self, delta_time, actions):
         """Update game state, handle animations, and check game logic."""
@@ -43,6 +55,15 @@ class GameWorld(State):
             self.game.logger.info("Pausing the game...")
             new_state = PauseMenu(self.game)
             new_state.enter_state()
+        if actions["autopilot"]:
+            self.toggle_autopilot()
+        if actions["rewind"]:
+            self.rewind()
+        snapshot = self.snapshot()
+        self.rewind_buffer.push(snapshot, self.play_time)
+        self.play_time += delta_time
+        if self.autopilot:
+            actions["jump"] = self.autopilot.decide(snapshot, delta_time)
         self.animation(delta_time, actions)
         self.check_and_update_score_when_bird_passes_pipe()
         self.check_for_game_over_conditions()
@@ -64,6 +85,66 @@ class GameWorld(State):
             self.game,
         )
         self.pipe_group.add(top_pipe, bottom_pipe)
+        # The generator only advances here, so snapshots share this copy until the next pipe spawns
+        self.random_state = self.random_generator.getstate()
+
+    def snapshot(self):
+        """
+        Captures the current state of the bird, pipes, score and random generator.
+
+        :return: WorldSnapshot that can be passed to restore.
+        """
+        return WorldSnapshot(
+            bird=self.bird.get_state(),
+            pipes=tuple(pipe.get_state() for pipe in self.pipe_group),
+            last_pipe=self.last_pipe,
+            score=self.score,
+            passing_through_pipe=self.passing_through_pipe,
+            ground_scroll=self.game.ground_scroll,
+            random_state=self.random_state,
+        )
+
+    def restore(self, snapshot):
+        """
+        Restores the bird, pipes, score and random generator from a snapshot.
+
+        :param snapshot: WorldSnapshot returned by snapshot.
+        """
+        self.bird.set_state(snapshot.bird)
+        self.pipe_group.empty()
+        self.pipe_group.add(
+            *(Pipe.from_state(state, self.game) for state in snapshot.pipes)
+        )
+        self.last_pipe = snapshot.last_pipe
+        self.score = snapshot.score
+        self.passing_through_pipe = snapshot.passing_through_pipe
+        self.game.ground_scroll = snapshot.ground_scroll
+        self.random_generator.setstate(snapshot.random_state)
+        self.random_state = snapshot.random_state
+
+    def rewind(self):
+        """Rewind the game world to a recently recorded snapshot."""
+        snapshot = self.rewind_buffer.rewind(self.REWIND_SECONDS)
+        if snapshot:
+            self.game.logger.info("Rewinding the game...")
+            self.stop_counting_for_high_score()
+            self.restore(snapshot)
+
+    def toggle_autopilot(self):
+        """Hand control of the bird over to the autopilot or back to the player."""
+        if self.autopilot:
+            self.game.logger.info("Autopilot disabled")
+            self.autopilot = None
+        else:
+            self.game.logger.info("Autopilot enabled")
+            self.autopilot = Autopilot(self.game)
+            self.stop_counting_for_high_score()
+
+    def stop_counting_for_high_score(self):
+        """Exclude the rest of the run from the high score, saving any high score the player reached so far."""
+        if self.counts_for_high_score:
+            self.game.save_high_score()
+            self.counts_for_high_score = False
 
     def render(self):
         """Render bird, pipes, and score on the screen."""
@@ -110,7 +191,7 @@ class GameWorld(State):
                 if bird.rect.left > pipe.rect.right:
                     self.score += 1
                     self.game.logger.info(f"Score: {self.score}")
-                    if self.score > self.game.high_score:
+                    if self.counts_for_high_score and self.score > self.game.high_score:
                         self.game.high_score = self.score
                         self.game.logger.info(
                             f"New High score: {self.game.high_score} !!!"
@@ -131,7 +212,8 @@ class GameWorld(State):
             or self.bird.rect.bottom >= self.game.GROUND_Y_POS
         ):
             self.thump.play()
-            self.game.save_high_score()
+            if self.counts_for_high_score:
+                self.game.save_high_score()
             self.game.logger.info("Game over!!!")
             from states.game_over_menu import GameOverMenu
 